@@ -1,10 +1,10 @@
 from typing import Callable, Awaitable
-import queue
+import collections
 import threading
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
 
 from asyncelevenlabs.conversation import AsyncAudioInterface
+from util.thread_priority import raise_thread_priority
 
 
 
@@ -18,18 +18,21 @@ class AsyncDefaultAudioInterface(AsyncAudioInterface):
         except ImportError:
             raise ImportError("To use DefaultAudioInterface you must install pyaudio.")
         self.pyaudio = pyaudio
-        
-        # Initialize queues and events
-        self.output_queue: queue.Queue[bytes] = queue.Queue()
+
+        # Initialize buffers and events
+        self._out_deque: collections.deque[bytes] = collections.deque()
         self.should_stop = threading.Event()
+        self.interrupted = threading.Event()
         self.loop: asyncio.AbstractEventLoop | None = None
-        self.thread_pool = ThreadPoolExecutor(max_workers=1)
-        
+
+        # Only touched from the PortAudio callback thread
+        self._in_pending = bytearray()
+        self._out_pending = bytearray()
+        self._priority_raised = False
+
         # Will be initialized in start()
         self.p = None
-        self.in_stream = None
-        self.out_stream = None
-        self.output_thread = None
+        self.stream = None
         self.input_callback = None
 
     async def start(self, input_callback: Callable[[bytes], Awaitable[None]]):
@@ -39,89 +42,77 @@ class AsyncDefaultAudioInterface(AsyncAudioInterface):
 
         # Initialize PyAudio in the main thread
         self.p = self.pyaudio.PyAudio()
-        
-        # Create a sync wrapper for the async input callback
-        def sync_input_wrapper(in_data, frame_count, time_info, status):
-            if self.input_callback and not self.should_stop.is_set():
-                # Schedule the async callback in the event loop
-                asyncio.run_coroutine_threadsafe(
-                    self.input_callback(in_data), 
-                    self.loop
-                )
-            return (None, self.pyaudio.paContinue)
-
-        # Open streams
-        self.in_stream = self.p.open(
+
+        # One duplex stream, so capture and playback share a PortAudio thread and block boundaries
+        self.stream = self.p.open(
             format=self.pyaudio.paInt16,
             channels=1,
             rate=16000,
             input=True,
-            stream_callback=sync_input_wrapper,
-            frames_per_buffer=self.INPUT_FRAMES_PER_BUFFER,
-            start=True,
-        )
-        
-        self.out_stream = self.p.open(
-            format=self.pyaudio.paInt16,
-            channels=1,
-            rate=16000,
             output=True,
+            stream_callback=self._duplex_callback,
             frames_per_buffer=self.OUTPUT_FRAMES_PER_BUFFER,
             start=True,
         )
 
-        # Start output thread
-        self.output_thread = threading.Thread(
-            target=self._output_thread,
-            daemon=True
-        )
-        self.output_thread.start()
-
     async def stop(self):
         """Stop the audio interface."""
         self.should_stop.set()
-        
-        if self.output_thread:
-            # Use thread pool to avoid blocking
-            await self.loop.run_in_executor(
-                self.thread_pool,
-                self.output_thread.join
-            )
 
         # Clean up PyAudio resources
-        if self.in_stream:
-            self.in_stream.stop_stream()
-            self.in_stream.close()
-        if self.out_stream:
-            self.out_stream.close()
+        if self.stream:
+            self.stream.stop_stream()
+            self.stream.close()
         if self.p:
             self.p.terminate()
 
-        # Clean up thread pool
-        self.thread_pool.shutdown(wait=False)
-
     async def output(self, audio: bytes):
         """Queue audio for output."""
         if not self.should_stop.is_set():
-            self.output_queue.put_nowait(audio)
+            self._out_deque.append(audio)
 
     async def interrupt(self):
-        """Clear the output queue to stop current audio."""
-        try:
-            while True:
-                self.output_queue.get_nowait()
-        except queue.Empty:
-            pass
-
-    def _output_thread(self):
-        """Thread for handling audio output."""
-        while not self.should_stop.is_set():
+        """Drop queued audio to stop current playback."""
+        # One call regardless of backlog; the callback holds at most one buffer
+        self._out_deque.clear()
+        # Makes the callback discard the partial buffer it is holding
+        self.interrupted.set()
+
+    def _duplex_callback(self, in_data, frame_count, time_info, status):
+        """PortAudio callback: forward captured audio and return the next output block."""
+        if not self._priority_raised:
+            # ALSA's PortAudio thread runs at normal priority, and a late callback is an audible dropout
+            raise_thread_priority()
+            self._priority_raised = True
+
+        if self.should_stop.is_set():
+            return (bytes(frame_count * 2), self.pyaudio.paContinue)
+
+        # Input arrives in output-sized blocks; hand it on in INPUT_FRAMES_PER_BUFFER chunks
+        self._in_pending.extend(in_data)
+        input_size = self.INPUT_FRAMES_PER_BUFFER * 2  # 2 bytes per paInt16 sample
+        if len(self._in_pending) >= input_size:
+            chunk = bytes(self._in_pending[:input_size])
+            del self._in_pending[:input_size]
+            if self.input_callback:
+                # Schedule the async callback in the event loop
+                asyncio.run_coroutine_threadsafe(self.input_callback(chunk), self.loop)
+
+        if self.interrupted.is_set():
+            self.interrupted.clear()
+            self._out_pending.clear()
+
+        output_size = frame_count * 2
+        pending = self._out_pending
+        while len(pending) < output_size:
             try:
-                audio = self.output_queue.get(timeout=0.25)
-                if not self.should_stop.is_set():
-                    self.out_stream.write(audio)
-            except queue.Empty:
-                continue
-            except Exception as e:
-                if not self.should_stop.is_set():
-                    print(f"Error in audio output thread: {e}")
\ No newline at end of file
+                pending.extend(self._out_deque.popleft())
+            except IndexError:
+                # Empty, possibly because interrupt() just cleared it
+                break
+        out_data = bytes(pending[:output_size])
+        del pending[:output_size]
+        if len(out_data) < output_size:
+            # Pad with silence when the agent isn't speaking or playback is catching up
+            out_data += bytes(output_size - len(out_data))
+        return (out_data, self.pyaudio.paContinue)
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 import base64
-import json
+from binascii import b2a_base64
+import orjson
 from typing import Callable, Optional, Any, Awaitable
 import asyncio
 from websockets.client import connect as ws_connect, WebSocketClientProtocol
@@ -52,10 +53,10 @@ class AsyncClientTools:
         if not self._running:
             raise RuntimeError("ClientTools is not running")
             
-        if tool_name not in self.tools:
+        handler = self.tools.get(tool_name)
+        if handler is None:
             raise ValueError(f"Tool '{tool_name}' is not registered")
             
-        handler = self.tools[tool_name]
         return await handler(parameters)
 
 class AsyncConversationInitiationData:
@@ -70,6 +71,17 @@ class AsyncConversationInitiationData:
         self.dynamic_variables = dynamic_variables or {}
 
 class AsyncConversation:
+    # Outgoing user audio frames are assembled from these instead of being serialized.
+    _AUDIO_CHUNK_PREFIX = b'{"user_audio_chunk":"'
+    _AUDIO_CHUNK_SUFFIX = b'"}'
+    _PONG_TEMPLATE = b'{"type":"pong","event_id":%b}'
+    _TOOL_OK_TEMPLATE = b'{"type":"client_tool_result","tool_call_id":%b,"result":%b,"is_error":false}'
+    _TOOL_ERROR_TEMPLATE = b'{"type":"client_tool_result","tool_call_id":%b,"result":%b,"is_error":true}'
+    # Pending calls per callback before the receive loop waits on a slow callback
+    CALLBACK_QUEUE_SIZE = 32
+    # Seconds end of session waits for queued callbacks before cancelling them
+    CALLBACK_DRAIN_TIMEOUT = 2.0
+
     def __init__(
         self,
         client: AsyncElevenLabs,
@@ -100,6 +112,21 @@ class AsyncConversation:
         self._ws = None
         self._running = False
         self._main_task = None
+        self._recv_task: Optional[asyncio.Task] = None
+        # One queue and consumer task per configured callback, created in _run()
+        self._cb_queues: dict[str, asyncio.Queue] = {}
+        self._cb_tasks: list[asyncio.Task] = []
+        # Message type -> handler, with the high-frequency "audio" type first
+        self._dispatch: dict[str, Callable[[dict], Awaitable[None]]] = {
+            "audio": self._on_audio,
+            "ping": self._on_ping,
+            "interruption": self._on_interruption,
+            "agent_response": self._on_agent_response,
+            "agent_response_correction": self._on_agent_response_correction,
+            "user_transcript": self._on_user_transcript,
+            "client_tool_call": self._on_client_tool_call,
+            "conversation_initiation_metadata": self._on_conversation_initiation_metadata,
+        }
 
     async def start_session(self):
         """Starts the conversation session."""
@@ -112,49 +139,63 @@ class AsyncConversation:
         self._main_task = asyncio.create_task(self._run(ws_url))
 
     async def _run(self, ws_url: str):
-        async with ws_connect(ws_url, max_size=16 * 1024 * 1024) as ws:
+        # No permessage-deflate: base64 audio barely compresses and inflating every frame costs CPU
+        async with ws_connect(ws_url, max_size=16 * 1024 * 1024, compression=None) as ws:
             self._ws = ws
             await self.client_tools.start()
+            self._start_callback_workers()
             
-            # Send initial configuration
-            await ws.send(json.dumps({
-                "type": "conversation_initiation_client_data",
-                "custom_llm_extra_body": self.config.extra_body,
-                "conversation_config_override": self.config.conversation_config_override,
-                "dynamic_variables": self.config.dynamic_variables,
-            }))
-
-            async def input_callback(audio: bytes):
-                if not self._running:
-                    return
-                try:
-                    await ws.send(json.dumps({
-                        "user_audio_chunk": base64.b64encode(audio).decode(),
-                    }))
-                except ConnectionClosedOK:
-                    await self.end_session()
-                except Exception as e:
-                    logging.error(f"Error sending user audio chunk: {e}")
-                    await self.end_session()
-
-            await self.audio_interface.start(input_callback)
-            
-            while self._running:
-                try:
-                    message = await asyncio.wait_for(ws.recv(), timeout=0.5)
+            try:
+                # Send initial configuration
+                await ws.send(orjson.dumps({
+                    "type": "conversation_initiation_client_data",
+                    "custom_llm_extra_body": self.config.extra_body,
+                    "conversation_config_override": self.config.conversation_config_override,
+                    "dynamic_variables": self.config.dynamic_variables,
+                }).decode())
+
+                async def input_callback(audio: bytes):
                     if not self._running:
-                        break
+                        return
+                    try:
+                        # The server expects text frames, so decode the ASCII payload once.
+                        await ws.send(b"".join((
+                            self._AUDIO_CHUNK_PREFIX,
+                            b2a_base64(audio, newline=False),
+                            self._AUDIO_CHUNK_SUFFIX,
+                        )).decode("ascii"))
+                    except ConnectionClosedOK:
+                        await self.end_session()
+                    except Exception as e:
+                        logging.error(f"Error sending user audio chunk: {e}")
+                        await self.end_session()
+
+                await self.audio_interface.start(input_callback)
+            
+                while self._running:
+                    try:
+                        # end_session() cancels this, so there is no need to poll _running
+                        self._recv_task = asyncio.create_task(ws.recv())
+                        message = await self._recv_task
+                        if not self._running:
+                            break
                     
-                    data = json.loads(message)
-                    await self._handle_message(data)
+                        data = orjson.loads(message)
+                        await self._handle_message(data)
                     
-                except asyncio.TimeoutError:
-                    continue
-                except ConnectionClosedOK:
-                    await self.end_session()
-                except Exception as e:
-                    logging.error(f"Error in websocket loop: {e}")
-                    await self.end_session()
+                    except asyncio.CancelledError:
+                        # end_session() cancelling _recv_task or this task is the expected exit; anything else propagates
+                        if not self._running:
+                            break
+                        raise
+                    except ConnectionClosedOK:
+                        await self.end_session()
+                    except Exception as e:
+                        logging.error(f"Error in websocket loop: {e}")
+                        await self.end_session()
+            finally:
+                # Also reached when the server hangs up or the loop errors, not only via end_session()
+                await self._stop_callback_workers()
 
     async def end_session(self):
         """Ends the conversation session and cleans up resources."""
@@ -162,8 +203,14 @@ class AsyncConversation:
             return
             
         self._running = False
-        
-        if self._main_task:
+
+        if self._recv_task:
+            self._recv_task.cancel()
+
+        # _run() itself calls this when the server hangs up, and a task can't await itself
+        if self._main_task and self._main_task is not asyncio.current_task():
+            # The loop may be parked on a full callback queue rather than in recv()
+            self._main_task.cancel()
             try:
                 await self._main_task
             except asyncio.CancelledError:
@@ -175,77 +222,119 @@ class AsyncConversation:
         if self._ws and not self._ws.closed:
             await self._ws.close()
 
+    def _start_callback_workers(self):
+        callbacks = {
+            "agent_response": self.callback_agent_response,
+            "agent_response_correction": self.callback_agent_response_correction,
+            "user_transcript": self.callback_user_transcript,
+            "latency_measurement": self.callback_latency_measurement,
+        }
+        for name, callback in callbacks.items():
+            if callback:
+                queue = asyncio.Queue(maxsize=self.CALLBACK_QUEUE_SIZE)
+                self._cb_queues[name] = queue
+                self._cb_tasks.append(asyncio.create_task(self._drain_callbacks(queue, callback)))
+
+    async def _stop_callback_workers(self):
+        """Deliver whatever is still queued (e.g. the final transcript), then stop the workers."""
+        queues, tasks = self._cb_queues, self._cb_tasks
+        self._cb_queues, self._cb_tasks = {}, []
+        if not tasks:
+            return
+        # Sentinels go in behind the queued calls; putting one into a full queue waits on its worker
+        sentinels = [asyncio.create_task(queue.put(None)) for queue in queues.values()]
+        _, pending = await asyncio.wait(tasks, timeout=self.CALLBACK_DRAIN_TIMEOUT)
+        # A callback that never returns must not hold up the end of the session
+        for task in (*pending, *sentinels):
+            task.cancel()
+
+    async def _drain_callbacks(self, queue: asyncio.Queue, callback: Callable[..., Awaitable[None]]):
+        """Run queued calls to one callback in order, one at a time, until a None sentinel."""
+        while True:
+            args = await queue.get()
+            if args is None:
+                return
+            try:
+                await callback(*args)
+            except Exception as e:
+                logging.error(f"Error in conversation callback: {e}")
+
     async def _handle_message(self, message: dict):
         """Handle websocket messages."""
-        msg_type = message["type"]
+        handler = self._dispatch.get(message["type"])
+        if handler:
+            await handler(message)
 
-        if msg_type == "conversation_initiation_metadata":
-            event = message["conversation_initiation_metadata_event"]
-            assert self._conversation_id is None
-            self._conversation_id = event["conversation_id"]
+    async def _on_audio(self, message: dict):
+        event = message["audio_event"]
+        if int(event["event_id"]) <= self._last_interrupt_id:
+            return
+        audio = base64.b64decode(event["audio_base_64"])
+        await self.audio_interface.output(audio)
 
-        elif msg_type == "audio":
-            event = message["audio_event"]
-            if int(event["event_id"]) <= self._last_interrupt_id:
-                return
-            audio = base64.b64decode(event["audio_base_64"])
-            await self.audio_interface.output(audio)
-
-        elif msg_type == "agent_response" and self.callback_agent_response:
-            event = message["agent_response_event"]
-            await self.callback_agent_response(event["agent_response"].strip())
-
-        elif msg_type == "agent_response_correction" and self.callback_agent_response_correction:
-            event = message["agent_response_correction_event"]
-            await self.callback_agent_response_correction(
-                event["original_agent_response"].strip(),
-                event["corrected_agent_response"].strip()
+    async def _on_conversation_initiation_metadata(self, message: dict):
+        event = message["conversation_initiation_metadata_event"]
+        assert self._conversation_id is None
+        self._conversation_id = event["conversation_id"]
+
+    async def _on_agent_response(self, message: dict):
+        queue = self._cb_queues.get("agent_response")
+        if not queue:
+            return
+        event = message["agent_response_event"]
+        await queue.put((event["agent_response"].strip(),))
+
+    async def _on_agent_response_correction(self, message: dict):
+        queue = self._cb_queues.get("agent_response_correction")
+        if not queue:
+            return
+        event = message["agent_response_correction_event"]
+        await queue.put((
+            event["original_agent_response"].strip(),
+            event["corrected_agent_response"].strip()
+        ))
+
+    async def _on_user_transcript(self, message: dict):
+        queue = self._cb_queues.get("user_transcript")
+        if not queue:
+            return
+        event = message["user_transcription_event"]
+        await queue.put((event["user_transcript"].strip(),))
+
+    async def _on_interruption(self, message: dict):
+        event = message["interruption_event"]
+        self._last_interrupt_id = int(event["event_id"])
+        await self.audio_interface.interrupt()
+
+    async def _on_ping(self, message: dict):
+        event = message["ping_event"]
+        await self._ws.send(
+            (self._PONG_TEMPLATE % orjson.dumps(event["event_id"])).decode()
+        )
+        queue = self._cb_queues.get("latency_measurement")
+        if queue and event["ping_ms"]:
+            await queue.put((int(event["ping_ms"]),))
+
+    async def _on_client_tool_call(self, message: dict):
+        tool_call = message.get("client_tool_call", {})
+        tool_name = tool_call.get("tool_name")
+        parameters = {
+            "tool_call_id": tool_call["tool_call_id"],
+            **tool_call.get("parameters", {})
+        }
+        
+        tool_call_id = orjson.dumps(parameters["tool_call_id"])
+        try:
+            result = await self.client_tools.handle(tool_name, parameters)
+            response = self._TOOL_OK_TEMPLATE % (
+                tool_call_id,
+                orjson.dumps(result or f"Client tool: {tool_name} called successfully."),
             )
+        except Exception as e:
+            response = self._TOOL_ERROR_TEMPLATE % (tool_call_id, orjson.dumps(str(e)))
 
-        elif msg_type == "user_transcript" and self.callback_user_transcript:
-            event = message["user_transcription_event"]
-            await self.callback_user_transcript(event["user_transcript"].strip())
-
-        elif msg_type == "interruption":
-            event = message["interruption_event"]
-            self._last_interrupt_id = int(event["event_id"])
-            await self.audio_interface.interrupt()
-
-        elif msg_type == "ping":
-            event = message["ping_event"]
-            await self._ws.send(json.dumps({
-                "type": "pong",
-                "event_id": event["event_id"],
-            }))
-            if self.callback_latency_measurement and event["ping_ms"]:
-                await self.callback_latency_measurement(int(event["ping_ms"]))
-
-        elif msg_type == "client_tool_call":
-            tool_call = message.get("client_tool_call", {})
-            tool_name = tool_call.get("tool_name")
-            parameters = {
-                "tool_call_id": tool_call["tool_call_id"],
-                **tool_call.get("parameters", {})
-            }
-            
-            try:
-                result = await self.client_tools.handle(tool_name, parameters)
-                response = {
-                    "type": "client_tool_result",
-                    "tool_call_id": parameters["tool_call_id"],
-                    "result": result or f"Client tool: {tool_name} called successfully.",
-                    "is_error": False,
-                }
-            except Exception as e:
-                response = {
-                    "type": "client_tool_result",
-                    "tool_call_id": parameters["tool_call_id"],
-                    "result": str(e),
-                    "is_error": True,
-                }
-
-            if self._running and self._ws:
-                await self._ws.send(json.dumps(response))
+        if self._running and self._ws:
+            await self._ws.send(response.decode())
 
     def _get_wss_url(self) -> str:
         base_url = self.client._client_wrapper._base_url
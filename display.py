@@ -5,5 +5,6 @@ class Display(ABC):
     def show_spinner(self) -> None:
         pass
 
+    @abstractmethod
     def turn_off(self) -> None:
         pass
@@ -8,6 +8,7 @@ import board
 pixel_pin = board.D12
 num_pixels = 8
 ORDER = neopixel.GRB
+SPINNER_COLOR = (255, 255, 255)
 
 class AnimationType(Enum):
     OFF = 0
@@ -18,29 +19,72 @@ class LedDisplay(Display):
         self.pixels = neopixel.NeoPixel(
             pixel_pin, num_pixels, brightness=0.1, auto_write=False, pixel_order=ORDER
         )
-        self.current_animation = AnimationType.CHASE
+        # Unknown until the first update, so the first turn_off() always reaches the LEDs
+        self.current_animation = None
+        self._chase_task: asyncio.Task = None
+        # Chase brightness indexed by (pixel - head position) % num_pixels
+        self._brightness = [
+            math.cos(min(d, num_pixels - d) * math.pi / num_pixels) * 0.5 + 0.1
+            for d in range(num_pixels)
+        ]
+        self._frames_color = None
+        self._chase_frames = []
+        # Render the spinner up front so show_spinner() only ever copies frames
+        self._get_chase_frames(SPINNER_COLOR)
 
     def show_spinner(self) -> None:
-        asyncio.create_task(self._chase_animation(duration=-1, color=(255, 255, 255)))
+        self.current_animation = AnimationType.CHASE
+        # A chase task that hasn't exited yet picks the state change up; a second one would double the LED writes
+        if self._chase_task and not self._chase_task.done():
+            return
+        self._chase_task = asyncio.create_task(self._chase_animation(duration=-1, color=SPINNER_COLOR))
 
     
-    async def _chase_animation(self, duration=-1, color=(255, 255, 255)):
+    async def _chase_animation(self, duration=-1, color=SPINNER_COLOR):
         self.current_animation = AnimationType.CHASE
-        start_time = asyncio.get_event_loop().time()
+        frames = self._get_chase_frames(color)
+        # Brightness-scaled, byte-ordered buffer that show() transmits
+        buf = self.pixels._post_brightness_buffer
+        pixels = self.pixels
         position = 0
-        while asyncio.get_event_loop().time() - start_time < duration or duration == -1:
+        if duration == -1:
+            # Runs until another animation (or turn_off) takes over, so there is no clock to check
+            while self.current_animation == AnimationType.CHASE:
+                buf[:] = frames[position]
+                pixels.show()
+                await asyncio.sleep(0.05)
+                position = (position + 1) % num_pixels
+            return
+
+        loop = asyncio.get_running_loop()
+        end_time = loop.time() + duration
+        while loop.time() < end_time:
             if self.current_animation != AnimationType.CHASE:
                 return
-            for i in range(num_pixels):
-                distance = min((i - position) % num_pixels, (position - i) % num_pixels)
-                brightness = math.cos(distance * math.pi / num_pixels) * 0.5 + 0.1
-                pixel_color = tuple(int(c * brightness) for c in color)
-                self.pixels[i] = pixel_color
-            self.pixels.show()
+            buf[:] = frames[position]
+            pixels.show()
             await asyncio.sleep(0.05)
             position = (position + 1) % num_pixels
 
+    def _get_chase_frames(self, color):
+        """Raw pixel buffers for each chase position, rendered once per color."""
+        if color != self._frames_color:
+            r, g, b = color
+            color_lut = [(int(r * k), int(g * k), int(b * k)) for k in self._brightness]
+            # Let the pixel library do the byte ordering and brightness scaling, then snapshot it
+            buf = self.pixels._post_brightness_buffer
+            frames = []
+            for position in range(num_pixels):
+                for i in range(num_pixels):
+                    self.pixels[i] = color_lut[(i - position) % num_pixels]
+                frames.append(bytes(buf))
+            self._chase_frames = frames
+            self._frames_color = color
+        return self._chase_frames
+
     def turn_off(self) -> None:
+        if self.current_animation == AnimationType.OFF:
+            return
         self.current_animation = AnimationType.OFF
         self.pixels.fill((0, 0, 0))
         self.pixels.show()
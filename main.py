@@ -1,9 +1,8 @@
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+import functools
 import json
 import logging
 import os
-import threading
 from display import Display
 from elevenlabs import ElevenLabs
 from elevenlabs.conversational_ai.conversation import Conversation, ClientTools
@@ -12,30 +11,37 @@ from spotify import play_spotify_track
 from wakeword import WakeWordDetector
 from util.is_raspberry import is_raspberry_pi
 from dotenv import load_dotenv
-from elevenlabs import AsyncElevenLabs
 
 load_dotenv()
 print(os.getenv("PORCUPINE_API_KEY"))
 
-# Set up the display based on the platform.
-display: Display = None
-if is_raspberry_pi():
-    print("Raspberry Pi detected")
-    from display_led import LedDisplay
-    display = LedDisplay()
-else:
+logging.basicConfig(level=logging.INFO)
+
+# Hardware and clients are built on first use and then reused, so importing this
+# module never opens the microphone, loads Porcupine or touches the LEDs.
+
+@functools.cache
+def get_display() -> Display:
+    """Set up the display based on the platform."""
+    if is_raspberry_pi():
+        print("Raspberry Pi detected")
+        from display_led import LedDisplay
+        return LedDisplay()
     from display_cli import CliDisplay
-    display = CliDisplay()
+    return CliDisplay()
 
-# Create both synchronous and asynchronous clients.
-async_elevenlabs_client = AsyncElevenLabs(api_key=os.getenv("ELEVENLABS_API_KEY"))
-elevenlabs_client = ElevenLabs(api_key=os.getenv("ELEVENLABS_API_KEY"))
-logging.basicConfig(level=logging.INFO)
+@functools.cache
+def get_elevenlabs_client() -> ElevenLabs:
+    return ElevenLabs(api_key=os.getenv("ELEVENLABS_API_KEY"))
+
+@functools.cache
+def get_wakeword() -> WakeWordDetector:
+    return WakeWordDetector()
 
 client_tools = ClientTools()
 
 async def play_existing_music(parameters: dict):
-    print(parameters)
+    logging.debug(f"playExistingSong parameters: {parameters}")
     try:
         songQuery = parameters.get("songQuery")
         logging.info(f"Requested music: {songQuery}")
@@ -45,65 +51,52 @@ async def play_existing_music(parameters: dict):
         return json.dumps({"error": f"Error playing existing music: {e}"})
 
 client_tools.register("playExistingSong", play_existing_music, is_async=True)
-wakeword = WakeWordDetector()
-
-# --- Create a dedicated event loop for callbacks ---
 
-callback_loop = asyncio.new_event_loop()
+# Set by main(). Conversation callbacks arrive on the SDK's thread, so display updates are handed to this loop.
+main_loop: asyncio.AbstractEventLoop = None
 
-def start_loop(loop):
-    asyncio.set_event_loop(loop)
-    loop.run_forever()
-
-# Run the callback loop in a separate daemon thread.
-threading.Thread(target=start_loop, args=(callback_loop,), daemon=True).start()
-
-# --- Define async helper functions for your callbacks ---
-
-async def _on_agent_response(response):
+def on_agent_response(response):
     print(f"Agent: {response}")
-    display.show_spinner()
+    main_loop.call_soon_threadsafe(get_display().show_spinner)
 
-async def _on_agent_response_correction(original, corrected):
+def on_agent_response_correction(original, corrected):
     print(f"Agent: {original} -> {corrected}")
-    display.show_spinner()
+    main_loop.call_soon_threadsafe(get_display().show_spinner)
 
-async def _on_user_transcript(transcript):
+def on_user_transcript(transcript):
     print(f"User: {transcript}")
-    display.turn_off()
+    main_loop.call_soon_threadsafe(get_display().turn_off)
+
+@functools.cache
+def get_conversation_kwargs() -> dict:
+    """Everything except the audio interface, which needs a fresh PortAudio stream per session."""
+    return dict(
+        requires_auth=True,
+        client=get_elevenlabs_client(),
+        agent_id=os.getenv("ELEVENLABS_AGENT_ID"),
+        client_tools=client_tools,
+        callback_agent_response=on_agent_response,
+        callback_agent_response_correction=on_agent_response_correction,
+        callback_user_transcript=on_user_transcript,
+    )
+
+async def start_session_async():
+    conversation = Conversation(audio_interface=DefaultAudioInterface(), **get_conversation_kwargs())
+    # Run the blocking call on the loop's default executor
+    await main_loop.run_in_executor(None, conversation.start_session)
 
 async def main():
+    global main_loop
+    main_loop = asyncio.get_running_loop()
+    display = get_display()
+    wakeword = get_wakeword()
     display.turn_off()
     while True:
-        await wakeword.wait_for_wake_word()
+        if not await wakeword.wait_for_wake_word():
+            # Capture failed (already logged); back off instead of starting a session
+            await asyncio.sleep(1)
+            continue
         display.show_spinner()
-
-        # Synchronous callback wrappers that schedule async tasks on our dedicated callback loop.
-        def on_agent_response(response):
-            asyncio.run_coroutine_threadsafe(_on_agent_response(response), callback_loop)
-
-        def on_agent_response_correction(original, corrected):
-            asyncio.run_coroutine_threadsafe(_on_agent_response_correction(original, corrected), callback_loop)
-
-        def on_user_transcript(transcript):
-            asyncio.run_coroutine_threadsafe(_on_user_transcript(transcript), callback_loop)
-
-       
-        async def start_session_async():
-            conversation = Conversation(
-                requires_auth=True,
-                client=elevenlabs_client,
-                agent_id=os.getenv("ELEVENLABS_AGENT_ID"),
-                client_tools=client_tools,
-                audio_interface=DefaultAudioInterface(),
-                callback_agent_response=on_agent_response,
-                callback_agent_response_correction=on_agent_response_correction,
-                callback_user_transcript=on_user_transcript,
-            )
-            loop = asyncio.get_running_loop()
-            with ThreadPoolExecutor() as pool:
-                # Run the blocking call in a thread pool
-                await loop.run_in_executor(pool, conversation.start_session)
         try:
             await start_session_async()
         except Exception as e:
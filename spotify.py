@@ -1,10 +1,17 @@
 import asyncio
 import logging
 import subprocess
-import json
-import shlex
+import orjson
 import traceback
 
+SPOTIFY_PLAYER = "/home/teak/.cargo/bin/spotify_player"
+SEARCH_ARGV = [SPOTIFY_PLAYER, "search"]
+PLAY_TRACK_ARGV = [SPOTIFY_PLAYER, "playback", "start", "radio", "track", "--id"]
+
+# First search hit per query, so asking for the same song again skips the search process
+MAX_CACHED_SEARCHES = 64
+_track_cache: dict[str, dict] = {}
+
 async def play_spotify_track(query: str) -> dict:
     """
     Search for a track on Spotify using spotify-player and start playback.
@@ -16,43 +23,47 @@ async def play_spotify_track(query: str) -> dict:
         dict: Track data including id, name, artist, etc. or error information
     """
     try:
-        # First, run the search command and capture its output
-        search_cmd = f'/home/teak/.cargo/bin/spotify_player search "{query}"'
-        logging.info(f"Running search command: {search_cmd}")
-        search_proc = await asyncio.create_subprocess_exec(
-            *shlex.split(search_cmd),
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
-        stdout, stderr = await search_proc.communicate()
-        
-        if search_proc.returncode != 0:
-            return {"error": f"Search failed: {stderr.decode()}"}
-            
-        # Parse the JSON output and get the first track's data
-        track_data = json.loads(stdout.decode())
-        if not track_data.get('tracks'):
-            return {"error": f"No tracks found for query: {query}"}
+        track = _track_cache.get(query)
+        if track is None:
+            # First, run the search command and capture its output.
+            # The query is passed as its own argv entry, so it never needs quoting.
+            logging.info(f"Running spotify_player search: {query}")
+            search_proc = await asyncio.create_subprocess_exec(
+                *SEARCH_ARGV, query,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            stdout, stderr = await search_proc.communicate()
             
-        track = track_data['tracks'][0]
+            if search_proc.returncode != 0:
+                return {"error": f"Search failed: {stderr.decode()}"}
+                
+            # Parse the JSON output straight from bytes and get the first track's data
+            track_data = orjson.loads(stdout)
+            if not track_data.get('tracks'):
+                return {"error": f"No tracks found for query: {query}"}
+                
+            track = track_data['tracks'][0]
+            if len(_track_cache) >= MAX_CACHED_SEARCHES:
+                # Dicts keep insertion order, so this evicts the oldest search
+                del _track_cache[next(iter(_track_cache))]
+            _track_cache[query] = track
         
         logging.info(f"Track data: {track}")
         # Start playback with the track ID
-        play_cmd = f'/home/teak/.cargo/bin/spotify_player playback start radio track --id {track["id"]}'
-        print(f"Running play command: {play_cmd}")
+        logging.debug(f"Running spotify_player playback for track id: {track['id']}")
         play_proc = await asyncio.create_subprocess_exec(
-            *shlex.split(play_cmd),
+            *PLAY_TRACK_ARGV, track["id"],
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE
         )
         play_stdout, play_stderr = await play_proc.communicate()
-        print("finished playing")
         if play_proc.returncode != 0:
             error_string = play_stderr.decode()
-            print(f"Playback failed: {error_string}")
+            logging.error(f"Playback failed: {error_string}")
             return {"error": f"Playback failed: {error_string}"}
         
-        print(f"Played track: {play_stdout.decode()}")      
+        logging.debug(f"Played track: {play_stdout.decode()}")
 
         logging.info(f"Playback started for track: {track['name']}")
         
@@ -61,7 +72,7 @@ async def play_spotify_track(query: str) -> dict:
             "track": track
         }
         
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         traceback.print_exc()
         logging.error(f"Error parsing search results: {e}")
         return {"error": f"Error parsing search results: {e}"}
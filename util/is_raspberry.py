@@ -1,16 +1,22 @@
+import functools
+
+# Markers for "Raspberry Pi" or common Pi hardware details in cpuinfo
+_PI_MARKERS = (
+    b'raspberry pi',
+    b'bcm2708',
+    b'bcm2709',
+    b'bcm2711',
+    b'bcm2835',
+    b'bcm2836',
+    b'bcm2837'
+)
+
+@functools.lru_cache(maxsize=1)
 def is_raspberry_pi() -> bool:
     try:
-        with open('/proc/cpuinfo', 'r') as f:
-            # Check for "Raspberry Pi" or common Pi hardware details in cpuinfo
+        # Scan the raw bytes; no need to decode cpuinfo to text first
+        with open('/proc/cpuinfo', 'rb') as f:
             cpuinfo = f.read().lower()
-            return any(marker in cpuinfo for marker in [
-                'raspberry pi',
-                'bcm2708',
-                'bcm2709',
-                'bcm2711',
-                'bcm2835',
-                'bcm2836',
-                'bcm2837'
-            ])
+            return any(marker in cpuinfo for marker in _PI_MARKERS)
     except:
         return False
\ No newline at end of file
@@ -0,0 +1,12 @@
+import os
+
+def raise_thread_priority(priority=20):
+    """Best-effort real-time scheduling for the calling thread."""
+    try:
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+    except (AttributeError, OSError):
+        # Not Linux, or no CAP_SYS_NICE; nice(-10) still needs privileges but is worth a try
+        try:
+            os.nice(-10)
+        except OSError:
+            pass
@@ -1,15 +1,21 @@
 
 import asyncio
+import collections
+import functools
 import logging
 import os
-from pvrecorder import PvRecorder
+import queue
+import threading
+from pvrecorder import PvRecorder, PvRecorderError
 import pvporcupine
 import pvcobra
-from pvrecorder import PvRecorder
 from util.is_raspberry import is_raspberry_pi
+from util.thread_priority import raise_thread_priority
 
-valid_microphone_names = ["USB PnP Sound Device", "PCM2902"]
+valid_microphone_names = ("USB PnP Sound Device", "PCM2902")
 
+# Device enumeration goes through the audio backend and is slow; the USB mic doesn't move while we run
+@functools.cache
 def find_microphone_index():
     devices = PvRecorder.get_available_devices()
     for i, device in enumerate(devices):
@@ -21,7 +27,15 @@ def find_microphone_index():
     return 0
 
 class WakeWordDetector:
-    def __init__(self, access_key=None, keyword=None, keyword_path=None):
+    def __init__(
+        self,
+        access_key=None,
+        keyword=None,
+        keyword_path=None,
+        vad_start_threshold=300,
+        vad_tail_frames=32,
+        vad_preroll_frames=8,
+    ):
         if access_key is None:
             access_key = os.getenv("PORCUPINE_API_KEY")
         if keyword is None:
@@ -33,40 +47,145 @@ class WakeWordDetector:
                 keyword_path = "models/wakeword/hey_milo_mac.ppn"
         self._access_key = access_key
         self._keyword = keyword
-        self._device_index = find_microphone_index()
         self._keyword_path = keyword_path
         self._stop_event = asyncio.Event()
+        # Energy gate in front of Porcupine: frames only reach it once the int16 peak
+        # crosses the start threshold, and for a tail window (32 frames ~ 1s) after the last
+        # loud frame. The last few gated frames (8 ~ 256ms) are replayed when the gate opens
+        # so Porcupine still hears the quiet start of the keyword.
+        self._vad_start_threshold = vad_start_threshold
+        self._vad_tail_frames = vad_tail_frames
+        self._vad_preroll_frames = vad_preroll_frames
 
-        self._porcupine = pvporcupine.create(
-            access_key=access_key,
-            keywords=[self._keyword],
-            keyword_paths=[self._keyword_path]
-        )
-        self._recorder = PvRecorder(frame_length=self._porcupine.frame_length, device_index=self._device_index)
+        # One capture thread and one inference thread for the detector's lifetime, started on the
+        # first wait_for_wake_word() since the result queue has to belong to the running loop
+        self._loop: asyncio.AbstractEventLoop = None
+        self._detections: asyncio.Queue = None
+        self._listening = threading.Event()
+        self._capture_thread: threading.Thread = None
+        self._infer_thread: threading.Thread = None
+        # Frames that cleared the VAD gate, on their way from capture to Porcupine
+        self._frames = queue.SimpleQueue()
 
-    async def wait_for_wake_word(self):
+        # Porcupine and the recorder are created on the first wait_for_wake_word()
+        self._device_index = None
+        self._porcupine = None
+        self._recorder = None
+        self._load_lock = asyncio.Lock()
+
+    async def _ensure_loaded(self):
+        """Load the keyword model and open the microphone, once."""
+        async with self._load_lock:
+            if self._porcupine is not None:
+                return
+            # Reading the .ppn model and enumerating devices both block, so keep them off the loop
+            self._device_index = await asyncio.to_thread(find_microphone_index)
+            self._porcupine = await asyncio.to_thread(
+                pvporcupine.create,
+                access_key=self._access_key,
+                keywords=[self._keyword],
+                keyword_paths=[self._keyword_path]
+            )
+            self._recorder = PvRecorder(frame_length=self._porcupine.frame_length, device_index=self._device_index)
+
+    def _report(self, result):
+        """Hand a detection or a capture error to wait_for_wake_word(), once per listening session."""
+        if self._listening.is_set():
+            self._listening.clear()
+            self._loop.call_soon_threadsafe(self._detections.put_nowait, result)
+
+    def _capture(self):
+        """Read frames and pass the ones that clear the VAD gate on to _infer()."""
+        # A late read lets the recorder's ring buffer overflow and drop the wake word. Only the
+        # read and the gate run at this priority; inference would starve the conversation's threads.
+        raise_thread_priority()
+        frames = self._frames
+        while True:
+            self._listening.wait()
+            # Frames since the last one above the VAD threshold; start out gated
+            silence_counter = self._vad_tail_frames
+            preroll = collections.deque(maxlen=self._vad_preroll_frames)
+            while self._listening.is_set():
+                try:
+                    pcm = self._recorder.read()
+                except Exception as e:
+                    # Either the recorder was stopped under us or it failed; only report the latter
+                    self._report(e)
+                    break
+
+                # PvRecorder frames are plain int lists, so max/min run in C without numpy
+                if max(max(pcm), -min(pcm)) > self._vad_start_threshold:
+                    silence_counter = 0
+                elif silence_counter < self._vad_tail_frames:
+                    silence_counter += 1
+                else:
+                    preroll.append(pcm)
+                    continue
+
+                while preroll:
+                    frames.put(preroll.popleft())
+                frames.put(pcm)
+
+    def _infer(self):
+        """Run Porcupine on gated frames, reporting only detections to the event loop."""
+        while True:
+            pcm = self._frames.get()
+            if not self._listening.is_set():
+                continue
+            try:
+                # pvporcupine calls the native library through ctypes, which drops the GIL
+                # for the inference, so the event loop keeps running meanwhile
+                if self._porcupine.process(pcm) >= 0:
+                    self._report(True)
+            except Exception as e:
+                self._report(e)
+
+    async def wait_for_wake_word(self) -> bool:
+        """Listen until the wake word is heard. Returns False if capture failed or stop() was called."""
+        await self._ensure_loaded()
+        if self._capture_thread is None:
+            self._loop = asyncio.get_running_loop()
+            # True on detection, an exception from capture, or None from stop()
+            self._detections = asyncio.Queue()
+            self._capture_thread = threading.Thread(target=self._capture, daemon=True)
+            self._capture_thread.start()
+            self._infer_thread = threading.Thread(target=self._infer, daemon=True)
+            self._infer_thread.start()
+        detections = self._detections
+        # Drop anything left over from the previous listening session
+        while not detections.empty():
+            detections.get_nowait()
+        while True:
+            try:
+                self._frames.get_nowait()
+            except queue.Empty:
+                break
         self._recorder.start()
-        wait_for_wakeword = False
+        self._listening.set()
         try:
-            is_recording = not wait_for_wakeword
-            silence_counter = 0
-            speech_counter = 0
             logging.info("Waiting for wake word...")
-            while not self._stop_event.is_set():
-                pcm = await asyncio.to_thread(self._recorder.read)
-                wake_word_index = self._porcupine.process(pcm)
+            if self._stop_event.is_set():
+                return False
+            result = await detections.get()
+            if isinstance(result, Exception):
+                raise result
+            if result:
+                logging.info(f'Wake word ({self._keyword}) detected!')
+                return True
+            return False
 
-                if wake_word_index >= 0:
-                    logging.info(f'Wake word ({self._keyword}) detected!')
-                    break
-               
-                await asyncio.sleep(0)
-
-        except Exception as e:
-            logging.error(f'Error: {e}')
+        except (PvRecorderError, pvporcupine.PorcupineError) as e:
+            # Anything else is a bug and should propagate
+            logging.error(f'Wake word capture failed: {e}')
+            return False
         finally:
+            self._listening.clear()
             self._recorder.stop()
 
     def stop(self):
         self._stop_event.set()
-        self._recorder.stop()
+        if self._recorder:
+            self._recorder.stop()
+        if self._loop:
+            # Wake a pending wait_for_wake_word(); safe from any thread
+            self._loop.call_soon_threadsafe(self._detections.put_nowait, None)